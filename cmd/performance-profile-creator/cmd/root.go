@@ -17,6 +17,7 @@
 package cmd
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -249,14 +250,23 @@ func getClusterData(mustGatherDirPath string) (ClusterData, error) {
 		return nil, fmt.Errorf("failed to load the cluster nodes: %v", err)
 	}
 
+	// the GHW snapshots directory is the same for every node, look it up only once
+	// and only when there is a node to load
+	var snapshotsPath string
 	for _, mcp := range mcps {
 		matchedNodes, err := profilecreator.GetNodesForPool(mcp, mcps, nodes)
 		if err != nil {
 			return nil, fmt.Errorf("failed to find MCP %s's nodes: %v", mcp.Name, err)
 		}
+		if len(matchedNodes) > 0 && snapshotsPath == "" {
+			snapshotsPath, err = profilecreator.GetGHWSnapshotsPath(mustGatherDirPath)
+			if err != nil {
+				return nil, fmt.Errorf("failed to load node's %s's GHW snapshot : %v", mcp.Name, err)
+			}
+		}
 		handlers := make([]*profilecreator.GHWHandler, len(matchedNodes))
 		for i, node := range matchedNodes {
-			handle, err := profilecreator.NewGHWHandler(mustGatherDirPath, node)
+			handle, err := profilecreator.NewGHWHandlerFromSnapshotsPath(snapshotsPath, node)
 			if err != nil {
 				return nil, fmt.Errorf("failed to load node's %s's GHW snapshot : %v", mcp.Name, err)
 			}
@@ -382,9 +392,6 @@ func getDataFromFlags(cmd *cobra.Command) (ProfileCreatorArgs, error) {
 	}
 	profileName := cmd.Flag("profile-name").Value.String()
 	tmPolicy := cmd.Flag("topology-manager-policy").Value.String()
-	if err != nil {
-		return creatorArgs, fmt.Errorf("failed to parse topology-manager-policy flag: %v", err)
-	}
 	err = validateFlag("topology-manager-policy", tmPolicy, validTMPolicyValues)
 	if err != nil {
 		return creatorArgs, fmt.Errorf("invalid value for topology-manager-policy flag specified: %v", err)
@@ -393,9 +400,6 @@ func getDataFromFlags(cmd *cobra.Command) (ProfileCreatorArgs, error) {
 		return creatorArgs, fmt.Errorf("not appropriate to split reserved CPUs in case of topology-manager-policy: %v", tmPolicy)
 	}
 	powerConsumptionMode := cmd.Flag("power-consumption-mode").Value.String()
-	if err != nil {
-		return creatorArgs, fmt.Errorf("failed to parse power-consumption-mode flag: %v", err)
-	}
 	err = validateFlag("power-consumption-mode", powerConsumptionMode, validPowerConsumptionModes)
 	if err != nil {
 		return creatorArgs, fmt.Errorf("invalid value for power-consumption-mode flag specified: %v", err)
@@ -473,16 +477,17 @@ func getProfileData(args ProfileCreatorArgs, cluster ClusterData) (*ProfileData,
 		return nil, fmt.Errorf("failed to compute the MCP selector: %v", err)
 	}
 
-	if len(cluster[mcp]) == 0 {
+	nodeHandlers := cluster[mcp]
+	if len(nodeHandlers) == 0 {
 		return nil, fmt.Errorf("no schedulable nodes are associated with '%s' MCP", args.MCPName)
 	}
 
-	var matchedNodeNames []string
-	for _, nodeHandler := range cluster[mcp] {
+	matchedNodeNames := make([]string, 0, len(nodeHandlers))
+	for _, nodeHandler := range nodeHandlers {
 		matchedNodeNames = append(matchedNodeNames, nodeHandler.Node.GetName())
 	}
 	log.Infof("Nodes targeted by %s MCP are: %v", args.MCPName, matchedNodeNames)
-	err = profilecreator.EnsureNodesHaveTheSameHardware(cluster[mcp])
+	err = profilecreator.EnsureNodesHaveTheSameHardware(nodeHandlers)
 	if err != nil {
 		return nil, fmt.Errorf("targeted nodes differ: %v", err)
 	}
@@ -491,7 +496,7 @@ func getProfileData(args ProfileCreatorArgs, cluster ClusterData) (*ProfileData,
 	// Assumption here is moving forward matchedNodes[0] is representative of how all the nodes are
 	// same from hardware topology point of view
 
-	nodeHandle := cluster[mcp][0]
+	nodeHandle := nodeHandlers[0]
 	systemInfo, err := nodeHandle.GatherSystemInfo()
 	if err != nil {
 		return nil, fmt.Errorf("failed to compute get system information: %v", err)
@@ -641,19 +646,16 @@ func createProfile(profileData ProfileData) error {
 		}
 	}
 
-	// write CSV to out dir
-	writer := strings.Builder{}
-	if err := MarshallObject(&profile, &writer); err != nil {
+	// write the profile straight to stdout, MarshallObject only writes once the YAML is complete
+	if err := MarshallObject(&profile, os.Stdout); err != nil {
 		return err
 	}
 
 	if profileData.enableHardwareTuning {
-		if _, err := writer.Write([]byte(hardwareTuningMessage)); err != nil {
+		if _, err := io.WriteString(os.Stdout, hardwareTuningMessage); err != nil {
 			return err
 		}
 	}
-
-	fmt.Printf("%s", writer.String())
 	return nil
 }
 
@@ -702,13 +704,11 @@ func MarshallObject(obj interface{}, writer io.Writer) error {
 	}
 
 	// fix double quoted strings by removing unneeded single quotes...
-	s := string(yamlBytes)
-	s = strings.Replace(s, " '\"", " \"", -1)
-	s = strings.Replace(s, "\"'\n", "\"\n", -1)
-
-	yamlBytes = []byte(s)
+	// done on the bytes directly to avoid converting the whole document to a string and back
+	yamlBytes = bytes.ReplaceAll(yamlBytes, []byte(" '\""), []byte(" \""))
+	yamlBytes = bytes.ReplaceAll(yamlBytes, []byte("\"'\n"), []byte("\"\n"))
 
-	_, err = writer.Write([]byte("---\n"))
+	_, err = io.WriteString(writer, "---\n")
 	if err != nil {
 		return err
 	}
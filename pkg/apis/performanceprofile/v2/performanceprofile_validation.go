@@ -39,6 +39,26 @@ const (
 	hugepagesSize1G = "1G"
 )
 
+var (
+	// supported hugepages sizes, currently we support only 2M and 1G(x86_64 architecture)
+	validHugePagesSizes = map[HugePageSize]struct{}{
+		hugepagesSize1G: {},
+		hugepagesSize2M: {},
+	}
+	validTopologyPolicies = map[string]struct{}{
+		kubeletconfigv1beta1.NoneTopologyManagerPolicy:           {},
+		kubeletconfigv1beta1.BestEffortTopologyManagerPolicy:     {},
+		kubeletconfigv1beta1.RestrictedTopologyManagerPolicy:     {},
+		kubeletconfigv1beta1.SingleNumaNodeTopologyManagerPolicy: {},
+	}
+	// compiled once, the validation runs on every admission request
+	hexIDRegex = regexp.MustCompile("^0x[0-9a-fA-F]+$")
+
+	// the messages below depend only on constants, so they are formatted once
+	invalidDefaultHugePagesSizeMsg = fmt.Sprintf("hugepages default size should be equal to %q or %q", hugepagesSize1G, hugepagesSize2M)
+	invalidHugePagesSizeMsg        = fmt.Sprintf("the page size should be equal to %q or %q", hugepagesSize1G, hugepagesSize2M)
+)
+
 // ValidateCreate implements webhook.Validator so a webhook will be registered for the type
 func (r *PerformanceProfile) ValidateCreate() (admission.Warnings, error) {
 	klog.Infof("Create validation for the performance profile %q", r.Name)
@@ -217,15 +237,14 @@ func (r *PerformanceProfile) validateHugePages() field.ErrorList {
 
 	// validate that default hugepages size has correct value, currently we support only 2M and 1G(x86_64 architecture)
 	if r.Spec.HugePages.DefaultHugePagesSize != nil {
-		defaultSize := *r.Spec.HugePages.DefaultHugePagesSize
-		if defaultSize != hugepagesSize1G && defaultSize != hugepagesSize2M {
-			allErrs = append(allErrs, field.Invalid(field.NewPath("spec.hugepages.defaultHugepagesSize"), r.Spec.HugePages.DefaultHugePagesSize, fmt.Sprintf("hugepages default size should be equal to %q or %q", hugepagesSize1G, hugepagesSize2M)))
+		if _, ok := validHugePagesSizes[*r.Spec.HugePages.DefaultHugePagesSize]; !ok {
+			allErrs = append(allErrs, field.Invalid(field.NewPath("spec.hugepages.defaultHugepagesSize"), r.Spec.HugePages.DefaultHugePagesSize, invalidDefaultHugePagesSizeMsg))
 		}
 	}
 
 	for i, page := range r.Spec.HugePages.Pages {
-		if page.Size != hugepagesSize1G && page.Size != hugepagesSize2M {
-			allErrs = append(allErrs, field.Invalid(field.NewPath("spec.hugepages.pages"), r.Spec.HugePages.Pages, fmt.Sprintf("the page size should be equal to %q or %q", hugepagesSize1G, hugepagesSize2M)))
+		if _, ok := validHugePagesSizes[page.Size]; !ok {
+			allErrs = append(allErrs, field.Invalid(field.NewPath("spec.hugepages.pages"), r.Spec.HugePages.Pages, invalidHugePagesSizeMsg))
 		}
 
 		allErrs = append(allErrs, r.validatePageDuplication(&page, r.Spec.HugePages.Pages[i+1:])...)
@@ -272,11 +291,7 @@ func (r *PerformanceProfile) validateNUMA() field.ErrorList {
 
 	// validate NUMA topology policy matches allowed values
 	if r.Spec.NUMA.TopologyPolicy != nil {
-		policy := *r.Spec.NUMA.TopologyPolicy
-		if policy != kubeletconfigv1beta1.NoneTopologyManagerPolicy &&
-			policy != kubeletconfigv1beta1.BestEffortTopologyManagerPolicy &&
-			policy != kubeletconfigv1beta1.RestrictedTopologyManagerPolicy &&
-			policy != kubeletconfigv1beta1.SingleNumaNodeTopologyManagerPolicy {
+		if _, ok := validTopologyPolicies[*r.Spec.NUMA.TopologyPolicy]; !ok {
 			allErrs = append(allErrs, field.Invalid(field.NewPath("spec.numa.topologyPolicy"), r.Spec.NUMA.TopologyPolicy, "unrecognized value for topologyPolicy"))
 		}
 	}
@@ -313,8 +328,7 @@ func (r *PerformanceProfile) validateNet() field.ErrorList {
 }
 
 func isValid16bitsHexID(v string) bool {
-	re := regexp.MustCompile("^0x[0-9a-fA-F]+$")
-	return re.MatchString(v) && len(v) < 7
+	return len(v) < 7 && hexIDRegex.MatchString(v)
 }
 
 func (r *PerformanceProfile) validateWorkloadHints() field.ErrorList {
@@ -421,16 +421,18 @@ func getSystemdContent(options []*unit.UnitOption) (string, error) {
 	return string(outBytes), nil
 }
 
+// hugepagesSizeKilobytes maps the supported hugepages sizes to their size in kilobytes
+var hugepagesSizeKilobytes = map[performancev2.HugePageSize]string{
+	components.HugepagesSize1G: "1048576",
+	components.HugepagesSize2M: "2048",
+}
+
 // GetHugepagesSizeKilobytes retruns hugepages size in kilobytes
 func GetHugepagesSizeKilobytes(hugepagesSize performancev2.HugePageSize) (string, error) {
-	switch hugepagesSize {
-	case "1G":
-		return "1048576", nil
-	case "2M":
-		return "2048", nil
-	default:
-		return "", fmt.Errorf("can not convert size %q to kilobytes", hugepagesSize)
+	if size, ok := hugepagesSizeKilobytes[hugepagesSize]; ok {
+		return size, nil
 	}
+	return "", fmt.Errorf("can not convert size %q to kilobytes", hugepagesSize)
 }
 
 func getTemplatedOvsFile(fsys fs.FS, templateName string, name string) ([]byte, error) {
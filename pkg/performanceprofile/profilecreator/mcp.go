@@ -74,8 +74,10 @@ func GetNodesForPool(pool *mcfgv1.MachineConfigPool, clusterPools []*mcfgv1.Mach
 		return nil, fmt.Errorf("invalid label selector: %v", err)
 	}
 
+	// the pool selectors are the same for every node, convert them only once
+	selectors := newPoolSelectors(clusterPools)
 	for _, n := range clusterNodes {
-		p, err := getPrimaryPoolForNode(n, clusterPools)
+		p, err := getPrimaryPoolForNode(n, selectors)
 		if err != nil {
 			log.Warningf("can't get pool for node %q: %v", n.Name, err)
 			continue
@@ -101,8 +103,26 @@ func GetNodesForPool(pool *mcfgv1.MachineConfigPool, clusterPools []*mcfgv1.Mach
 	return nodes, nil
 }
 
+// poolSelector pairs a MachineConfigPool with its parsed node selector
+type poolSelector struct {
+	pool     *mcfgv1.MachineConfigPool
+	selector labels.Selector
+	err      error
+}
+
+// newPoolSelectors parses the node selector of every pool; a parsing error is kept
+// with its pool and reported when the pool is matched against a node
+func newPoolSelectors(clusterPools []*mcfgv1.MachineConfigPool) []poolSelector {
+	selectors := make([]poolSelector, len(clusterPools))
+	for i, p := range clusterPools {
+		selector, err := metav1.LabelSelectorAsSelector(p.Spec.NodeSelector)
+		selectors[i] = poolSelector{pool: p, selector: selector, err: err}
+	}
+	return selectors
+}
+
 // getPrimaryPoolForNode uses getPoolsForNode and returns the first one which is the one the node targets
-func getPrimaryPoolForNode(node *corev1.Node, clusterPools []*mcfgv1.MachineConfigPool) (*mcfgv1.MachineConfigPool, error) {
+func getPrimaryPoolForNode(node *corev1.Node, clusterPools []poolSelector) (*mcfgv1.MachineConfigPool, error) {
 	pools, err := getPoolsForNode(node, clusterPools)
 	if err != nil {
 		return nil, err
@@ -117,7 +137,7 @@ func getPrimaryPoolForNode(node *corev1.Node, clusterPools []*mcfgv1.MachineConf
 // It disambiguates in the case where e.g. a node has both master/worker roles applied,
 // and where a custom role may be used. It returns a slice of all the pools the node belongs to.
 // It also ignores the Windows nodes.
-func getPoolsForNode(node *corev1.Node, clusterPools []*mcfgv1.MachineConfigPool) ([]*mcfgv1.MachineConfigPool, error) {
+func getPoolsForNode(node *corev1.Node, clusterPools []poolSelector) ([]*mcfgv1.MachineConfigPool, error) {
 	if isWindows(node) {
 		// This is not an error, is this a Windows Node and it won't be managed by MCO. We're explicitly logging
 		// here at a high level to disambiguate this from other pools = nil  scenario
@@ -126,18 +146,18 @@ func getPoolsForNode(node *corev1.Node, clusterPools []*mcfgv1.MachineConfigPool
 	}
 
 	var pools []*mcfgv1.MachineConfigPool
+	nodeLabels := labels.Set(node.Labels)
 	for _, p := range clusterPools {
-		selector, err := metav1.LabelSelectorAsSelector(p.Spec.NodeSelector)
-		if err != nil {
-			return nil, fmt.Errorf("invalid label selector: %v", err)
+		if p.err != nil {
+			return nil, fmt.Errorf("invalid label selector: %v", p.err)
 		}
 
 		// If a pool with a nil or empty selector creeps in, it should match nothing, not everything.
-		if selector.Empty() || !selector.Matches(labels.Set(node.Labels)) {
+		if p.selector.Empty() || !p.selector.Matches(nodeLabels) {
 			continue
 		}
 
-		pools = append(pools, p)
+		pools = append(pools, p.pool)
 	}
 
 	if len(pools) == 0 {
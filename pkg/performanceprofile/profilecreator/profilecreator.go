@@ -18,12 +18,15 @@ package profilecreator
 
 import (
 	"fmt"
+	"io/fs"
 	"os"
 	"path"
 	"path/filepath"
 	"reflect"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/jaypipes/ghw"
 	"github.com/jaypipes/ghw/pkg/cpu"
@@ -77,7 +80,7 @@ func getMustGatherFullPathsWithFilter(mustGatherPath string, suffix string, filt
 	var paths []string
 
 	// don't assume directory names, only look for the suffix, filter out files having "filter" in their names
-	err := filepath.Walk(mustGatherPath, func(path string, info os.FileInfo, err error) error {
+	err := filepath.WalkDir(mustGatherPath, func(path string, d fs.DirEntry, err error) error {
 		if strings.HasSuffix(path, suffix) {
 			if len(filter) == 0 || !strings.Contains(path, filter) {
 				paths = append(paths, path)
@@ -103,14 +106,8 @@ func getMustGatherFullPaths(mustGatherPath string, suffix string) (string, error
 	return getMustGatherFullPathsWithFilter(mustGatherPath, suffix, "")
 }
 
-func getNode(mustGatherDirPath, nodeName string) (*v1.Node, error) {
+func decodeNode(path string) (*v1.Node, error) {
 	var node v1.Node
-	nodePathSuffix := path.Join(ClusterScopedResources, CoreNodes, nodeName)
-	path, err := getMustGatherFullPaths(mustGatherDirPath, nodePathSuffix)
-	if err != nil {
-		return nil, fmt.Errorf("failed to get MachineConfigPool for %s: %v", nodeName, err)
-	}
-
 	src, err := os.Open(path)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open %q: %v", path, err)
@@ -126,8 +123,6 @@ func getNode(mustGatherDirPath, nodeName string) (*v1.Node, error) {
 
 // GetNodeList returns the list of nodes using the Node YAMLs stored in Must Gather
 func GetNodeList(mustGatherDirPath string) ([]*v1.Node, error) {
-	machines := make([]*v1.Node, 0)
-
 	nodePathSuffix := path.Join(ClusterScopedResources, CoreNodes)
 	nodePath, err := getMustGatherFullPaths(mustGatherDirPath, nodePathSuffix)
 	if err != nil {
@@ -141,13 +136,32 @@ func GetNodeList(mustGatherDirPath string) ([]*v1.Node, error) {
 	if err != nil {
 		return nil, fmt.Errorf("failed to list mustGatherPath directories: %v", err)
 	}
-	for _, node := range nodes {
-		nodeName := node.Name()
-		node, err := getNode(mustGatherDirPath, nodeName)
+
+	// the node files are read straight from the directory found above rather than
+	// walking the whole must-gather tree again for each one of them.
+	// Decoding the files is independent per node, so it is spread over a bounded
+	// number of goroutines; the results keep the directory order.
+	machines := make([]*v1.Node, len(nodes))
+	errs := make([]error, len(nodes))
+	sem := make(chan struct{}, runtime.NumCPU())
+	var wg sync.WaitGroup
+	for i, node := range nodes {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, nodeName string) {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+			machines[i], errs[i] = decodeNode(filepath.Join(nodePath, nodeName))
+		}(i, node.Name())
+	}
+	wg.Wait()
+
+	for i, err := range errs {
 		if err != nil {
-			return nil, fmt.Errorf("failed to get Nodes %s: %v", nodeName, err)
+			return nil, fmt.Errorf("failed to get Nodes %s: %v", nodes[i].Name(), err)
 		}
-		machines = append(machines, node)
 	}
 	return machines, nil
 }
@@ -209,20 +223,31 @@ func GetMCP(mustGatherDirPath, mcpName string) (*machineconfigv1.MachineConfigPo
 
 // NewGHWHandler is a handler to use ghw options corresponding to a node
 func NewGHWHandler(mustGatherDirPath string, node *v1.Node) (*GHWHandler, error) {
-	nodeName := node.GetName()
-	nodePathSuffix := path.Join(Nodes)
-	nodepath, err := getMustGatherFullPathsWithFilter(mustGatherDirPath, nodePathSuffix, ClusterScopedResources)
+	nodepath, err := GetGHWSnapshotsPath(mustGatherDirPath)
 	if err != nil {
-		return nil, fmt.Errorf("can't obtain the node path %s: %v", nodeName, err)
+		return nil, fmt.Errorf("can't obtain the node path %s: %v", node.GetName(), err)
 	}
-	_, err = os.Stat(path.Join(nodepath, nodeName, SysInfoFileName))
+	return NewGHWHandlerFromSnapshotsPath(nodepath, node)
+}
+
+// GetGHWSnapshotsPath returns the must-gather directory holding the GHW snapshots of the nodes.
+// Callers creating handlers for several nodes can look it up once and use NewGHWHandlerFromSnapshotsPath.
+func GetGHWSnapshotsPath(mustGatherDirPath string) (string, error) {
+	return getMustGatherFullPathsWithFilter(mustGatherDirPath, path.Join(Nodes), ClusterScopedResources)
+}
+
+// NewGHWHandlerFromSnapshotsPath is a handler to use ghw options corresponding to a node,
+// with the node's GHW snapshot read from the directory returned by GetGHWSnapshotsPath
+func NewGHWHandlerFromSnapshotsPath(nodepath string, node *v1.Node) (*GHWHandler, error) {
+	nodeName := node.GetName()
+	_, err := os.Stat(path.Join(nodepath, nodeName, SysInfoFileName))
 	if err != nil {
 		return nil, fmt.Errorf("can't obtain the path: %s for node %s: %v", nodeName, nodepath, err)
 	}
 	options := ghw.WithSnapshot(ghw.SnapshotOptions{
 		Path: path.Join(nodepath, nodeName, SysInfoFileName),
 	})
-	ghwHandler := &GHWHandler{snapShotOptions: options, Node: node}
+	ghwHandler := &GHWHandler{snapShotOptions: options, Node: node, cache: &ghwCache{}}
 	return ghwHandler, nil
 }
 
@@ -230,19 +255,72 @@ func NewGHWHandler(mustGatherDirPath string, node *v1.Node) (*GHWHandler, error)
 type GHWHandler struct {
 	snapShotOptions *option.Option
 	Node            *v1.Node
+	cache           *ghwCache
+}
+
+// ghwCache memoizes the information read from a GHW snapshot.
+// Every ghw query unpacks the whole snapshot tarball, while the snapshot content never
+// changes during the handler lifetime, so each kind of information is read at most once.
+// The sorted views are built inside their sync.Once and never modified afterwards, so the
+// cached objects can be shared by concurrent callers, as documented on the GHWHandler methods.
+type ghwCache struct {
+	cpuOnce sync.Once
+	cpuInfo *cpu.Info
+	cpuErr  error
+
+	sortedCPUOnce sync.Once
+	sortedCPUInfo *cpu.Info
+	sortedCPUErr  error
+
+	topologyOnce sync.Once
+	topologyInfo *topology.Info
+	topologyErr  error
 }
 
 // CPU returns a CPUInfo struct that contains information about the CPUs on the host system
+// The returned object is read once per handler and shared by every caller, it must not be modified.
 func (ghwHandler GHWHandler) CPU() (*cpu.Info, error) {
-	return ghw.CPU(ghwHandler.snapShotOptions)
+	if ghwHandler.cache == nil {
+		return ghw.CPU(ghwHandler.snapShotOptions)
+	}
+	ghwHandler.cache.cpuOnce.Do(func() {
+		ghwHandler.cache.cpuInfo, ghwHandler.cache.cpuErr = ghw.CPU(ghwHandler.snapShotOptions)
+	})
+	return ghwHandler.cache.cpuInfo, ghwHandler.cache.cpuErr
 }
 
+// SortedCPU returns a CPUInfo struct that contains information about the CPUs sorted by processor, core and cpu ids on the host system
+// The returned object is read once per handler and shared by every caller, it must not be modified.
 func (ghwHandler GHWHandler) SortedCPU() (*cpu.Info, error) {
-	cpuInfo, err := ghw.CPU(ghwHandler.snapShotOptions)
+	if ghwHandler.cache == nil {
+		return ghwHandler.readSortedCPU()
+	}
+	ghwHandler.cache.sortedCPUOnce.Do(func() {
+		ghwHandler.cache.sortedCPUInfo, ghwHandler.cache.sortedCPUErr = ghwHandler.readSortedCPU()
+	})
+	return ghwHandler.cache.sortedCPUInfo, ghwHandler.cache.sortedCPUErr
+}
+
+// readSortedCPU sorts a copy of the CPU info, leaving the one returned by CPU() untouched
+func (ghwHandler GHWHandler) readSortedCPU() (*cpu.Info, error) {
+	info, err := ghwHandler.CPU()
 	if err != nil {
 		return nil, fmt.Errorf("can't obtain cpuInfo info from GHW snapshot: %v", err)
 	}
 
+	cpuInfo := *info
+	cpuInfo.Processors = make([]*cpu.Processor, len(info.Processors))
+	for i, p := range info.Processors {
+		processor := *p
+		processor.Cores = make([]*cpu.ProcessorCore, len(p.Cores))
+		for j, c := range p.Cores {
+			core := *c
+			core.LogicalProcessors = append([]int(nil), c.LogicalProcessors...)
+			processor.Cores[j] = &core
+		}
+		cpuInfo.Processors[i] = &processor
+	}
+
 	sort.Slice(cpuInfo.Processors, func(x, y int) bool {
 		return cpuInfo.Processors[x].ID < cpuInfo.Processors[y].ID
 	})
@@ -259,11 +337,22 @@ func (ghwHandler GHWHandler) SortedCPU() (*cpu.Info, error) {
 		})
 	}
 
-	return cpuInfo, nil
+	return &cpuInfo, nil
 }
 
 // SortedTopology returns a TopologyInfo struct that contains information about the Topology sorted by numa ids and cpu ids on the host system
+// The returned object is read once per handler and shared by every caller, it must not be modified.
 func (ghwHandler GHWHandler) SortedTopology() (*topology.Info, error) {
+	if ghwHandler.cache == nil {
+		return ghwHandler.readSortedTopology()
+	}
+	ghwHandler.cache.topologyOnce.Do(func() {
+		ghwHandler.cache.topologyInfo, ghwHandler.cache.topologyErr = ghwHandler.readSortedTopology()
+	})
+	return ghwHandler.cache.topologyInfo, ghwHandler.cache.topologyErr
+}
+
+func (ghwHandler GHWHandler) readSortedTopology() (*topology.Info, error) {
 	topologyInfo, err := ghw.Topology(ghwHandler.snapShotOptions)
 	if err != nil {
 		return nil, fmt.Errorf("can't obtain topology info from GHW snapshot: %v", err)
@@ -337,6 +426,8 @@ type systemInfo struct {
 	HtEnabled    bool
 }
 
+// GatherSystemInfo collects the sorted CPU and topology info of the node along with its hyperthreading state.
+// The CPU and topology info are the objects shared by the handler, they must not be modified.
 func (ghwHandler GHWHandler) GatherSystemInfo() (*systemInfo, error) {
 	cpuInfo, err := ghwHandler.SortedCPU()
 	if err != nil {
@@ -371,7 +462,7 @@ func CalculateCPUSets(systemInfo *systemInfo, reservedCPUCount int, offlinedCPUC
 
 	// Need to update Topology info to avoid using sibling Logical processors
 	// if user want to "disable" them in the kernel
-	updatedTopologyInfo, err := updateTopologyInfo(topologyInfo, disableHTFlag, systemInfo.HtEnabled)
+	updatedTopologyInfo, err := updateTopologyInfo(topologyInfo, disableHTFlag, htEnabled)
 	if err != nil {
 		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
 	}
@@ -381,18 +472,18 @@ func CalculateCPUSets(systemInfo *systemInfo, reservedCPUCount int, offlinedCPUC
 		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
 	}
 
-	cpuInfo := updatedExtCPUInfo.CpuInfo
+	totalThreads := int(updatedExtCPUInfo.CpuInfo.TotalThreads)
 	// Check limits are in range
-	if reservedCPUCount <= 0 || reservedCPUCount >= int(cpuInfo.TotalThreads) {
-		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please specify the reserved CPU count in the range [1,%d]", cpuInfo.TotalThreads-1)
+	if reservedCPUCount <= 0 || reservedCPUCount >= totalThreads {
+		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please specify the reserved CPU count in the range [1,%d]", totalThreads-1)
 	}
 
-	if offlinedCPUCount < 0 || offlinedCPUCount >= int(cpuInfo.TotalThreads) {
-		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please specify the offlined CPU count in the range [0,%d]", cpuInfo.TotalThreads-1)
+	if offlinedCPUCount < 0 || offlinedCPUCount >= totalThreads {
+		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please specify the offlined CPU count in the range [0,%d]", totalThreads-1)
 	}
 
-	if reservedCPUCount+offlinedCPUCount >= int(cpuInfo.TotalThreads) {
-		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please ensure that reserved-cpu-count plus offlined-cpu-count should be in the range [0,%d]", cpuInfo.TotalThreads-1)
+	if reservedCPUCount+offlinedCPUCount >= totalThreads {
+		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, fmt.Errorf("please ensure that reserved-cpu-count plus offlined-cpu-count should be in the range [0,%d]", totalThreads-1)
 	}
 
 	// Calculate reserved cpus.
@@ -401,15 +492,19 @@ func CalculateCPUSets(systemInfo *systemInfo, reservedCPUCount int, offlinedCPUC
 		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
 	}
 
-	updatedExtCPUInfo, err = updateExtendedCPUInfo(updatedExtCPUInfo, reserved, disableHTFlag, htEnabled)
-	if err != nil {
-		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
-	}
 	//Calculate offlined cpus
-	// note this takes into account the reserved cpus from the step above
-	offlined, err := getOfflinedCPUs(updatedExtCPUInfo, offlinedCPUCount, disableHTFlag, htEnabled, highPowerConsumptionMode)
-	if err != nil {
-		return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
+	// note this takes into account the reserved cpus from the step above.
+	// Nothing to offline is the common case, skip the CPU info copy altogether.
+	offlined := cpuset.New()
+	if offlinedCPUCount > 0 {
+		updatedExtCPUInfo, err = updateExtendedCPUInfo(updatedExtCPUInfo, reserved, disableHTFlag, htEnabled)
+		if err != nil {
+			return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
+		}
+		offlined, err = getOfflinedCPUs(updatedExtCPUInfo, offlinedCPUCount, disableHTFlag, htEnabled, highPowerConsumptionMode)
+		if err != nil {
+			return cpuset.CPUSet{}, cpuset.CPUSet{}, cpuset.CPUSet{}, err
+		}
 	}
 
 	// Calculate isolated cpus.
@@ -583,7 +678,7 @@ func (ca *cpuAccumulator) AddCoresWithFilter(max int, cores []*cpu.ProcessorCore
 func (ca *cpuAccumulator) Result() cpuset.CPUSet {
 	ca.done = true
 
-	var keys []int
+	keys := make([]int, 0, len(ca.elems))
 	for k := range ca.elems {
 		keys = append(keys, k)
 	}
@@ -688,10 +783,6 @@ func EnsureNodesHaveTheSameHardware(nodeHandlers []*GHWHandler) error {
 	}
 
 	for _, handle := range nodeHandlers[1:] {
-		if err != nil {
-			return fmt.Errorf("can't obtain GHW snapshot handle for %s: %v", handle.Node.GetName(), err)
-		}
-
 		topology, err := handle.SortedTopology()
 		if err != nil {
 			return fmt.Errorf("can't obtain Topology info from GHW snapshot for %s: %v", handle.Node.GetName(), err)
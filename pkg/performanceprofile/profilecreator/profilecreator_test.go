@@ -2,8 +2,11 @@ package profilecreator
 
 import (
 	"fmt"
+	"os"
+	"path"
 	"path/filepath"
 	"sort"
+	"sync"
 
 	"github.com/jaypipes/ghw/pkg/cpu"
 	"github.com/jaypipes/ghw/pkg/topology"
@@ -201,6 +204,56 @@ var _ = Describe("PerformanceProfileCreator: Getting Nodes from Must Gather", fu
 			Expect(err).ToNot(HaveOccurred())
 			Expect(len(nodes)).To(Equal(5))
 		})
+		It("decodes the whole Node", func() {
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			nodes, err := GetNodeList(mustGatherDirAbsolutePath)
+			Expect(err).ToNot(HaveOccurred())
+			var node *v1.Node
+			for _, n := range nodes {
+				if n.GetName() == "worker1" {
+					node = n
+				}
+			}
+			Expect(node).ToNot(BeNil())
+			Expect(node.GetLabels()).ToNot(BeEmpty())
+			Expect(node.Status.Capacity.Cpu().Value()).To(Equal(int64(80)))
+			Expect(node.Status.NodeInfo.Architecture).To(Equal("amd64"))
+			Expect(node.Status.Images).ToNot(BeEmpty())
+			Expect(node.Status.Conditions).ToNot(BeEmpty())
+			Expect(node.Status.Addresses).ToNot(BeEmpty())
+		})
+		It("keeps the Nodes in the must-gather directory order", func() {
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			nodes, err := GetNodeList(mustGatherDirAbsolutePath)
+			Expect(err).ToNot(HaveOccurred())
+			nodePath, err := getMustGatherFullPaths(mustGatherDirAbsolutePath, path.Join(ClusterScopedResources, CoreNodes))
+			Expect(err).ToNot(HaveOccurred())
+			nodeFiles, err := os.ReadDir(nodePath)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(nodes).To(HaveLen(len(nodeFiles)))
+			for i, nodeFile := range nodeFiles {
+				Expect(nodes[i].GetName() + YAMLSuffix).To(Equal(nodeFile.Name()))
+			}
+		})
+		It("reports the first Node that fails to decode", func() {
+			mustGatherDirAbsolutePath = GinkgoT().TempDir()
+			nodePath := filepath.Join(mustGatherDirAbsolutePath, ClusterScopedResources, CoreNodes)
+			Expect(os.MkdirAll(nodePath, 0755)).To(Succeed())
+			nodeFiles := map[string]string{
+				"node-a.yaml": "apiVersion: v1\nkind: Node\nmetadata:\n  name: node-a\n",
+				"node-b.yaml": "metadata: [\n",
+				"node-c.yaml": "metadata: [\n",
+				"node-d.yaml": "apiVersion: v1\nkind: Node\nmetadata:\n  name: node-d\n",
+			}
+			for name, content := range nodeFiles {
+				Expect(os.WriteFile(filepath.Join(nodePath, name), []byte(content), 0644)).To(Succeed())
+			}
+			_, err := GetNodeList(mustGatherDirAbsolutePath)
+			Expect(err).To(HaveOccurred())
+			Expect(err.Error()).To(ContainSubstring("failed to get Nodes node-b.yaml"))
+		})
 		It("fails to get Nodes due to misconfigured must-gather path", func() {
 			mustGatherDirAbsolutePath, err = filepath.Abs("foo-path")
 			_, err := GetNodeList(mustGatherDirAbsolutePath)
@@ -231,6 +284,104 @@ var _ = Describe("PerformanceProfileCreator: Consuming GHW Snapshot from Must Ga
 			Expect(err).ToNot(HaveOccurred())
 			Expect(len(topologyInfo.Nodes)).To(Equal(2))
 		})
+		It("reads the GHW snapshot only once per handler", func() {
+			node = newTestNode("worker1")
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node)
+			Expect(err).ToNot(HaveOccurred())
+			cpuInfo, err := handle.CPU()
+			Expect(err).ToNot(HaveOccurred())
+			sameCPUInfo, err := handle.CPU()
+			Expect(err).ToNot(HaveOccurred())
+			Expect(sameCPUInfo).To(BeIdenticalTo(cpuInfo))
+			sortedCPUInfo, err := handle.SortedCPU()
+			Expect(err).ToNot(HaveOccurred())
+			sameSortedCPUInfo, err := handle.SortedCPU()
+			Expect(err).ToNot(HaveOccurred())
+			Expect(sameSortedCPUInfo).To(BeIdenticalTo(sortedCPUInfo))
+			topologyInfo, err := handle.SortedTopology()
+			Expect(err).ToNot(HaveOccurred())
+			sortedTopologyInfo, err := handle.SortedTopology()
+			Expect(err).ToNot(HaveOccurred())
+			Expect(sortedTopologyInfo).To(BeIdenticalTo(topologyInfo))
+		})
+		It("does not modify the CPU info when sorting it", func() {
+			node = newTestNode("worker1")
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node)
+			Expect(err).ToNot(HaveOccurred())
+			uncachedHandle := GHWHandler{snapShotOptions: handle.snapShotOptions, Node: node}
+			expectedCPUInfo, err := uncachedHandle.CPU()
+			Expect(err).ToNot(HaveOccurred())
+			_, err = handle.SortedCPU()
+			Expect(err).ToNot(HaveOccurred())
+			cpuInfo, err := handle.CPU()
+			Expect(err).ToNot(HaveOccurred())
+			Expect(cpuInfo.Processors).To(Equal(expectedCPUInfo.Processors))
+		})
+		It("serves the GHW snapshot info to concurrent callers", func() {
+			node = newTestNode("worker1")
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node)
+			Expect(err).ToNot(HaveOccurred())
+
+			const callers = 4
+			cpuInfos := make([]*cpu.Info, callers)
+			topologyInfos := make([]*topology.Info, callers)
+			errs := make([]error, callers)
+			var wg sync.WaitGroup
+			for i := 0; i < callers; i++ {
+				wg.Add(1)
+				go func(i int) {
+					defer GinkgoRecover()
+					defer wg.Done()
+					if topologyInfos[i], errs[i] = handle.SortedTopology(); errs[i] != nil {
+						return
+					}
+					if cpuInfos[i], errs[i] = handle.SortedCPU(); errs[i] != nil {
+						return
+					}
+					_, errs[i] = handle.IsHyperthreadingEnabled()
+				}(i)
+			}
+			wg.Wait()
+
+			for i := 0; i < callers; i++ {
+				Expect(errs[i]).ToNot(HaveOccurred())
+				Expect(cpuInfos[i]).To(BeIdenticalTo(cpuInfos[0]))
+				Expect(topologyInfos[i]).To(BeIdenticalTo(topologyInfos[0]))
+			}
+		})
+		It("creates the Nodes handlers from a GHW snapshots path looked up once", func() {
+			mustGatherDirAbsolutePath, err = filepath.Abs(mustGatherDirPath)
+			Expect(err).ToNot(HaveOccurred())
+			snapshotsPath, err := GetGHWSnapshotsPath(mustGatherDirAbsolutePath)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(filepath.Join(snapshotsPath, "worker1", SysInfoFileName)).To(BeAnExistingFile())
+
+			for _, nodeName := range []string{"worker1", "worker2"} {
+				handle, err := NewGHWHandlerFromSnapshotsPath(snapshotsPath, newTestNode(nodeName))
+				Expect(err).ToNot(HaveOccurred())
+				Expect(handle.Node.GetName()).To(Equal(nodeName))
+			}
+			handle, err := NewGHWHandlerFromSnapshotsPath(snapshotsPath, newTestNode("worker1"))
+			Expect(err).ToNot(HaveOccurred())
+			cpuInfo, err := handle.CPU()
+			Expect(err).ToNot(HaveOccurred())
+			Expect(int(cpuInfo.TotalThreads)).To(Equal(80))
+
+			_, err = NewGHWHandlerFromSnapshotsPath(snapshotsPath, newTestNode("foo"))
+			Expect(err).To(HaveOccurred())
+		})
+		It("fails to get the GHW snapshots path due to misconfigured must-gather path", func() {
+			mustGatherDirAbsolutePath, err = filepath.Abs("foo-path")
+			Expect(err).ToNot(HaveOccurred())
+			_, err := GetGHWSnapshotsPath(mustGatherDirAbsolutePath)
+			Expect(err).To(HaveOccurred())
+		})
 		It("fails to get Nodes Info due to misconfigured must-gather path", func() {
 			mustGatherDirAbsolutePath, err = filepath.Abs("foo-path")
 			_, err := NewGHWHandler(mustGatherDirAbsolutePath, node)
@@ -1363,13 +1514,11 @@ var _ = Describe("PerformanceProfileCreator: Ensuring Nodes hardware equality",
 			mustGatherDirAbsolutePath, err := filepath.Abs(mustGatherDirPath)
 			Expect(err).ToNot(HaveOccurred())
 
-			node1, err := getNode(mustGatherDirAbsolutePath, "worker1.yaml")
-			Expect(err).ToNot(HaveOccurred())
+			node1 := newTestNode("worker1")
 			node1Handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node1)
 			Expect(err).ToNot(HaveOccurred())
 
-			node2, err := getNode(mustGatherDirAbsolutePath, "worker1.yaml")
-			Expect(err).ToNot(HaveOccurred())
+			node2 := newTestNode("worker1")
 			node2Handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node2)
 			Expect(err).ToNot(HaveOccurred())
 
@@ -1384,13 +1533,11 @@ var _ = Describe("PerformanceProfileCreator: Ensuring Nodes hardware equality",
 			mustGatherDirAbsolutePath, err := filepath.Abs(mustGatherDirPath)
 			Expect(err).ToNot(HaveOccurred())
 
-			node1, err := getNode(mustGatherDirAbsolutePath, "worker1.yaml")
-			Expect(err).ToNot(HaveOccurred())
+			node1 := newTestNode("worker1")
 			node1Handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node1)
 			Expect(err).ToNot(HaveOccurred())
 
-			node2, err := getNode(mustGatherDirAbsolutePath, "worker2.yaml")
-			Expect(err).ToNot(HaveOccurred())
+			node2 := newTestNode("worker2")
 			node2Handle, err := NewGHWHandler(mustGatherDirAbsolutePath, node2)
 			Expect(err).ToNot(HaveOccurred())
 